@@ -357,10 +357,9 @@ class Graph(object):
         assert n in self.nodes, ('Node(%s) does not exist in the graph!' % n)
         input_edges = []
         for start, v in self._adj_dict.items():
-            for end, edges in v.items():
-                if end == n:
-                    for edge_key, edge in edges.items():
-                        input_edges.append((start, end, edge_key, edge._attr))
+            if n in v:
+                for edge_key, edge in v[n].items():
+                    input_edges.append((start, n, edge_key, edge._attr))
         input_edges = sorted(
             input_edges, key=lambda x: (x[3]['dst_in_port'] if x[3]['dst_in_port'] is not None else 0, x[2]))
         if keys and data:
@@ -377,11 +376,9 @@ class Graph(object):
         '''Arrange out_edges in the order of dst_in_port.'''
         assert n in self.nodes, ('Node(%s) does not exist in the graph!' % n)
         output_edges = []
-        for start, v in self._adj_dict.items():
-            if start == n:
-                for end, edges in v.items():
-                    for edge_key, edge in edges.items():
-                        output_edges.append((start, end, edge_key, edge._attr))
+        for end, edges in self._adj_dict.get(n, {}).items():
+            for edge_key, edge in edges.items():
+                output_edges.append((n, end, edge_key, edge._attr))
         output_edges = sorted(
             output_edges, key=lambda x: (x[3]['src_out_port'] if x[3]['src_out_port'] is not None else 0, x[2]))
         if keys and data:
@@ -105,6 +105,22 @@ def has_path(g, source, target):
     return True
 
 
+def reachable_nodes(g, sources):
+    '''Get the set of nodes that can be reached from any of the source nodes.'''
+    visited = set(src for src in sources if g.has_node(src))
+    fringe = list(visited)
+    succ = g.succ
+    while fringe:
+        next_fringe = []
+        for v in fringe:
+            for w in succ[v]:
+                if w not in visited:
+                    visited.add(w)
+                    next_fringe.append(w)
+        fringe = next_fringe
+    return visited
+
+
 def cal_path_length(g, source, target):
     try:
         sp = _shortest_path_length(g, source, target)
@@ -709,6 +709,27 @@ class OpHasAxis(Op):
             np_axes[negative_axes] += len_shape
         return np_axes.tolist()
 
+    @staticmethod
+    def reduce_sum_square(tensor, axes, keepdims=True):
+        '''Return the sum of squares of tensor along axes. The square and the sum are
+        fused into one einsum contraction, so no squared copy of tensor is created.
+        Float tensors are accumulated in float64 and the result is cast back to their dtype.'''
+        axes = axes if isinstance(axes, (list, tuple)) else [axes]
+        axes = OpHasAxis.make_axes_non_negative(axes, len(tensor.shape))
+        in_subscripts = ''.join([chr(ord('a') + i)
+                                 for i in range(len(tensor.shape))])
+        out_subscripts = ''.join([s for i, s in enumerate(
+            in_subscripts) if i not in axes])
+        is_float = np.issubdtype(tensor.dtype, np.floating)
+        ret = np.einsum('%s,%s->%s' % (in_subscripts, in_subscripts, out_subscripts),
+                        tensor, tensor, dtype=np.float64 if is_float else None)
+        if is_float:
+            ret = np.asarray(ret).astype(tensor.dtype, copy=False)
+        if keepdims:
+            ret = np.reshape(ret, [1 if i in axes else d for i,
+                                   d in enumerate(tensor.shape)])
+        return ret
+
     def __init__(self, graph, attr_dict=None):
         super(OpHasAxis, self).__init__(graph, attr_dict)
         self.update_attributes(OpHasAxis, attr_dict)
@@ -13,6 +13,14 @@ from ..common.utils import list_list_to_string, get_random_array
 from ..logger import INFO, DEBUG, WARN, ERROR, FATAL
 
 
+def _shape_stub(shape, dtype):
+    '''Return a tensor that only carries shape and dtype for ops whose output values are not inferred.
+    Integer tensors are zero-filled because they may be used as indices by the following ops.'''
+    if np.dtype(dtype).kind == 'f':
+        return np.empty(shape, dtype=dtype)
+    return np.zeros(shape, dtype=dtype)
+
+
 class ArmAbsOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     @classmethod
     def cast_in_ports(cls):
@@ -148,7 +156,7 @@ class ArmActivationOp(LayoutUnawareOp, OpHasMethod, OpHasOneOutPort, ArmOp):
         elif self.method == 'THRESHOLDEDRELU':
             out_tensor = self.thresholded_relu()
         else:
-            out_tensor = func(inputs[0]).eval().astype(np.float32)
+            out_tensor = func(inputs[0]).eval().astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
     def gelu(self):
@@ -156,7 +164,7 @@ class ArmActivationOp(LayoutUnawareOp, OpHasMethod, OpHasOneOutPort, ArmOp):
         if self.approximate == 'tanh':
             out = 0.5*(inputs[0])*(1.0+tf.math.tanh(inputs[0]
                                                     * 0.7978845608*(1.0+0.044715*inputs[0]*inputs[0])))
-            out_tensor = out.eval().astype(np.float32)
+            out_tensor = out.eval().astype(np.float32, copy=False)
         else:
             out_tensor = 0.5 * \
                 (inputs[0])*(1.0+(inputs[0]*0.7978845608 *
@@ -173,16 +181,16 @@ class ArmActivationOp(LayoutUnawareOp, OpHasMethod, OpHasOneOutPort, ArmOp):
 
     def selu(self):
         inputs = self.get_input_tensors()
-        out_tensor = inputs[0]
+        out_tensor = np.array(inputs[0])
         mask = out_tensor <= 0
         out_tensor[mask] = self.alpha * (np.exp(out_tensor[mask]) - 1)
         out_tensor = self.gamma * out_tensor
-        out_tensor = out_tensor.astype(np.float32)
+        out_tensor = out_tensor.astype(np.float32, copy=False)
         return out_tensor
 
     def thresholded_relu(self):
         inputs = self.get_input_tensors()
-        out_tensor = inputs[0]
+        out_tensor = np.array(inputs[0])
         mask = out_tensor < self.alpha
         out_tensor[mask] = 0
         return out_tensor
@@ -454,7 +462,7 @@ class ArmBatchNormOp(BaseLinearOp, OpHasAxis, ArmOp):
         if self.axis < 0:
             self.axis += len(inputs[0].shape)
         out_tensor = (inputs[0] * self.weights +
-                      self.biases).astype(np.float32)
+                      self.biases).astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -538,7 +546,7 @@ class ArmBNLLOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
         super(ArmBNLLOp, self).infer_shape()
         inputs = self.get_input_tensors()
         out_tensor = np.log(1. + np.exp(*inputs))
-        out_tensor = out_tensor.astype(np.float32)
+        out_tensor = out_tensor.astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
 
@@ -561,7 +569,7 @@ class ArmBoundingBoxOp(OpHasMultipleOutPorts, ArmOp):
         super(ArmBoundingBoxOp, self).infer_shape()
         inputs = self.get_input_tensors()
         batch_size = inputs[0].shape[0]
-        out_tensor1 = copy.deepcopy(inputs[0])
+        out_tensor1 = inputs[0].copy()
         out_tensor2 = np.zeros([batch_size, 1], np.int32)
         self.set_out_tensor([out_tensor1, out_tensor2, out_tensor2])
 
@@ -1192,7 +1200,7 @@ class ArmDecodeBoxOp(OpHasWeights, OpHasMultipleOutPorts, ArmOp):
         height = ymax - ymin
         ycenter = ymin + height / 2.
         xcenter = xmin + width / 2.
-        return np.squeeze(np.stack([ycenter, xcenter, height, width], axis=2), axis=0).astype(np.float32)
+        return np.squeeze(np.stack([ycenter, xcenter, height, width], axis=2), axis=0).astype(np.float32, copy=False)
 
     @staticmethod
     def generate_anchors_for_resnet(fig_size,
@@ -1734,12 +1742,13 @@ class ArmGatherElementsOp(OpHasAxis, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmGatherElementsOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        indices = inputs[1]
+        # Normalize a copy of the indices: make_indices_non_negative works in place
+        indices = np.array(inputs[1], np.int64)
         from .onnx_ops.array_ops import GatherElementsOp
         indices = GatherElementsOp.make_indices_non_negative(
             indices, inputs[0].shape[self.axis])
         torch_input = torch.from_numpy(inputs[0])
-        torch_indices = torch.from_numpy(np.array(indices, np.int64))
+        torch_indices = torch.from_numpy(indices)
         out_tensor = torch.gather(torch_input, self.axis, torch_indices)
         out_tensor = out_tensor.numpy()
         self.set_out_tensor(out_tensor)
@@ -1970,7 +1979,7 @@ class ArmGroupNormOp(OpHasAxis, OpHasBiases, OpHasWeights, OpHasOneOutPort, ArmO
                              1 else 1 for i in range(len(inputs[0].shape))]
         weights = np.reshape(self.weights, weight_bias_shape)
         biases = np.reshape(self.biases, weight_bias_shape)
-        normalized = (normalized * weights + biases).astype(np.float32)
+        normalized = (normalized * weights + biases).astype(np.float32, copy=False)
         out_tensor = np.transpose(normalized, Op.cal_inverse_perm(src_perm))
         self.set_out_tensor(out_tensor)
 
@@ -2134,7 +2143,7 @@ class ArmInstanceNormOp(OpHasBiases, OpHasWeights, OpHasOneOutPort, ArmOp):
         ngamma = 1.0 / ((variance + self.epsilon) ** (.5))
         normalized = (inputs[0] - mean) * ngamma
         out_tensor = (normalized * self.weights +
-                      self.biases).astype(np.float32)
+                      self.biases).astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2200,7 +2209,7 @@ class ArmLayerNormOp(OpHasAxis, OpHasBiases, OpHasWeights, OpHasOneOutPort, ArmO
             self.axes, len(inputs[0].shape))
         weights = OpHasAxis.expand_to(self.weights, axes, len(inputs[0].shape))
         biases = OpHasAxis.expand_to(self.biases, axes, len(inputs[0].shape))
-        out_tensor = (normalized * weights + biases).astype(np.float32)
+        out_tensor = (normalized * weights + biases).astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2272,14 +2281,15 @@ class ArmLogicalOp(LayoutUnawareOp, OpHasMethod, OpHasOneOutPort, ArmOp):
 
     def __init__(self, graph, attr_dict=None):
         super(ArmLogicalOp, self).__init__(graph, attr_dict)
-        self.update_attributes(ArmLogSoftmaxOp, attr_dict)
-        assert self.check_required(), 'ArmLogSoftmaxOp is missing a required parameter.'
+        self.update_attributes(ArmLogicalOp, attr_dict)
+        assert self.check_required(), 'ArmLogicalOp is missing a required parameter.'
 
     def infer_shape(self):
         super(ArmLogicalOp, self).infer_shape()
         inputs = self.get_input_tensors()
         logical_func = ArmLogicalOp.FUNC_MAP[self.method]
-        out_tensor = logical_func(*inputs).astype(np.uint8)
+        out_tensor = np.empty(np.broadcast(*inputs).shape, dtype=np.uint8)
+        logical_func(*inputs, out=out_tensor.view(np.bool_))
         self.set_out_tensor(out_tensor)
 
 
@@ -2304,16 +2314,17 @@ class ArmLRNOp(OpHasMethod, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmLRNOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        perm1 = [0, len(inputs[0].shape) - 1] + \
-            list(range(1, len(inputs[0].shape) - 1))
-        perm2 = [0] + list(range(2, len(inputs[0].shape))) + [1]
-        inp = np.transpose(inputs[0], axes=perm1)
-        lrn = torch.nn.functional.local_response_norm(torch.from_numpy(inp),
-                                                      self.size,
-                                                      alpha=self.alpha,
-                                                      beta=self.beta,
-                                                      k=self.bias).numpy()
-        out_tensor = np.transpose(lrn, axes=perm2)
+        # Sum the squares over a window of channels(the last axis) by the difference
+        # of cumulative sums. The window is padded in the same way as torch's LRN,
+        # with one more zero in front as the start of the cumulative sums.
+        square_pads = [(0, 0)] * (len(inputs[0].shape) - 1) + \
+            [(self.size // 2 + 1, (self.size - 1) // 2)]
+        square_cumsum = np.cumsum(np.pad(np.square(inputs[0]), square_pads),
+                                  axis=-1, dtype=np.float64)
+        square_sum = square_cumsum[..., self.size:] - \
+            square_cumsum[..., :-self.size]
+        out_tensor = (inputs[0] / np.power(self.bias + self.alpha / self.size * square_sum,
+                                           self.beta)).astype(inputs[0].dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2364,11 +2375,13 @@ class ArmMatMulOp(OpHasOneOutPort, ArmOp):
         inputs = self.get_input_tensors()
         if len(inputs[0].shape) != 4 or len(inputs[1].shape) != 4:
             WARN('[Parser]: Currently only 4 dim input are supported in ArmMatMulOp.!')
-        A = inputs[0] if not bool(self.trans_a) else np.transpose(
-            inputs[0], (0, 1, 3, 2))
-        B = inputs[1] if not bool(self.trans_b) else np.transpose(
-            inputs[1], (0, 1, 3, 2))
-        out_tensor = np.matmul(A, B)
+        A, B = inputs[0], inputs[1]
+        m = A.shape[-1] if self.trans_a else A.shape[-2]
+        n = B.shape[-2] if self.trans_b else B.shape[-1]
+        batch_shape = np.broadcast(np.empty(A.shape[:-2], np.bool_),
+                                   np.empty(B.shape[:-2], np.bool_)).shape
+        out_tensor = np.empty(batch_shape + (m, n),
+                              dtype=np.result_type(A, B))
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2402,7 +2415,10 @@ class ArmMatMulIntegerOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmMatMulIntegerOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.matmul(*inputs).astype(np.int32)
+        batch_shape = np.broadcast(np.empty(inputs[0].shape[:-2], np.bool_),
+                                   np.empty(inputs[1].shape[:-2], np.bool_)).shape
+        out_tensor = np.zeros(batch_shape + (inputs[0].shape[-2], inputs[1].shape[-1]),
+                              dtype=np.int32)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2433,34 +2449,31 @@ class ArmMaxPoolingWithArgMaxOp(OpHasPaddingStrides, OpHasMultipleOutPorts, ArmO
     def infer_shape(self):
         super(ArmMaxPoolingWithArgMaxOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        input_tensor = torch.from_numpy(
-            np.transpose(inputs[0], axes=(0, 3, 1, 2)))
-        inp = torch.nn.functional.pad(input_tensor, self.torch_pads, mode='constant', value=0) \
-            if self.auto_pad == 'NOTSET' \
-            else input_tensor
-        out_tensors = torch.nn.functional.max_pool2d(inp,
-                                                     kernel_size=(
-                                                         self.kernel_shape[0], self.kernel_shape[1]),
-                                                     stride=(
-                                                         self.strides[0], self.strides[1]),
-                                                     dilation=(
-                                                         self.dilations[0], self.dilations[1]),
-                                                     return_indices=True,
-                                                     ceil_mode=bool(
-                                                         self.ceil_mode)
-                                                     )
-        out_tensors = [t.numpy() if i == 0 else t.numpy().astype(np.int32)
-                       for i, t in enumerate(out_tensors)]
-        out_tensors = [np.transpose(t, axes=(0, 2, 3, 1)) for t in out_tensors]
-        self.set_out_tensor(out_tensors)
+        batch, spatial_shape, channel = inputs[0].shape[0], inputs[0].shape[1:-
+                                                                            1], inputs[0].shape[-1]
+        out_shape = BaseOnnxPoolOp.cal_out_shape(spatial_shape,
+                                                 self.pads,
+                                                 self.strides,
+                                                 self.kernel_shape,
+                                                 self.auto_pad,
+                                                 dilations=self.dilations,
+                                                 ceil_mode=self.ceil_mode)
+        out_tensor = np.empty(
+            [batch] + out_shape + [channel], dtype=inputs[0].dtype)
+        indices_tensor = np.zeros(
+            [batch] + out_shape + [channel], dtype=np.int32)
+        self.set_out_tensor([out_tensor, indices_tensor])
 
     def write_attrs(self, txt_file):
         ret = super(ArmMaxPoolingWithArgMaxOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('ceil_mode=%s\n' %
-                           str(bool(self.ceil_mode)).lower())
-            txt_file.write('flatten_dim=%s\n' % self.flatten_dim)
-            txt_file.write('storage_order=%d\n' % self.storage_order)
+            txt_file.write('ceil_mode=%s\n'
+                           'flatten_dim=%s\n'
+                           'storage_order=%d\n'
+                           % (str(bool(self.ceil_mode)).lower(),
+                              self.flatten_dim,
+                              self.storage_order))
+        return ret
 
 
 class ArmMaxRoiPoolOp(OpHasOneOutPort, ArmOp):
@@ -2488,8 +2501,8 @@ class ArmMaxRoiPoolOp(OpHasOneOutPort, ArmOp):
         inputs = self.get_input_tensors()
         roi_num = inputs[1].shape[0]
         channels = inputs[0].shape[-1]
-        out_tensor = np.random.ranf(
-            (roi_num, *self.pooled_shape, channels)).astype(np.float32)
+        out_tensor = np.empty(
+            (roi_num, *self.pooled_shape, channels), dtype=np.float32)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2526,7 +2539,7 @@ class ArmMaxUnpoolOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmMaxUnpoolOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.random.ranf(self.output_shape).astype(inputs[0].dtype)
+        out_tensor = np.empty(self.output_shape, dtype=inputs[0].dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2554,8 +2567,8 @@ class ArmMeshgridOp(OpHasMultipleOutPorts, ArmOp):
     def infer_shape(self):
         super(ArmMeshgridOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensors = tf.meshgrid(*inputs, indexing=self.indexing)
-        out_tensors = [t.eval() for t in out_tensors]
+        out_tensors = np.meshgrid(
+            *inputs, indexing=self.indexing, sparse=bool(self.sparse))
         self.set_out_tensor(out_tensors)
 
     def write_attrs(self, txt_file):
@@ -2588,12 +2601,16 @@ class ArmModOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmModOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        if str(inputs[0].dtype) == 'float32' and not bool(self.fmod):
-            WARN(
-                '[Parser]: Mod Op(%s) with fmod=0 does not comply with float inputs!' % self.name)
-        with np.errstate(divide='ignore'):
-            out_tensor = np.mod(
-                *inputs) if self.fmod == 0 else np.fmod(*inputs)
+        mod_func = np.fmod if bool(self.fmod) else np.mod
+        if inputs[0].dtype.kind == 'f':
+            if not bool(self.fmod):
+                WARN(
+                    '[Parser]: Mod Op(%s) with fmod=0 does not comply with float inputs!' % self.name)
+            out_tensor = mod_func(*inputs)
+        else:
+            # Only integer division by zero raises the divide warning.
+            with np.errstate(divide='ignore'):
+                out_tensor = mod_func(*inputs)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2607,10 +2624,14 @@ class ArmMomentsOp(OpHasMultipleOutPorts, OpHasAxis, ArmOp):
     def infer_shape(self):
         super(ArmMomentsOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensors = tf.nn.moments(
-            inputs[0], self.axes, keepdims=self.keepdims)
-        out_tensors = [out_tensor.eval() for out_tensor in out_tensors]
-        self.set_out_tensor(out_tensors)
+        axes = tuple(self.axes)
+        mean = np.mean(inputs[0], axis=axes, keepdims=True)
+        # Two-pass variance: E[(X-EX)^2] does not cancel like E[X^2]-E[X]^2 does
+        variance = OpHasAxis.reduce_sum_square(
+            inputs[0] - mean, axes, keepdims=self.keepdims) * (mean.size / inputs[0].size)
+        if not self.keepdims:
+            mean = np.squeeze(mean, axis=axes)
+        self.set_out_tensor([mean, variance])
 
 
 class ArmMVNOp(OpHasOneOutPort, OpHasAxis, ArmOp):
@@ -2635,9 +2656,13 @@ class ArmMVNOp(OpHasOneOutPort, OpHasAxis, ArmOp):
     def infer_shape(self):
         super(ArmMVNOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        data_mean = np.mean(inputs[0], axis=tuple(self.axes), keepdims=True)
-        data_std = np.std(inputs[0], axis=tuple(self.axes), keepdims=True)
-        out_tensor = (inputs[0] - data_mean) / (data_std + self.epsilon)
+        axes = tuple(self.axes)
+        data_mean = np.mean(inputs[0], axis=axes, keepdims=True)
+        out_tensor = np.subtract(inputs[0], data_mean)
+        # Two-pass variance over the centered data, which does not cancel like E[X^2]-E[X]^2
+        data_std = np.sqrt(OpHasAxis.reduce_sum_square(
+            out_tensor, axes) * (data_mean.size / inputs[0].size))
+        np.divide(out_tensor, data_std + self.epsilon, out=out_tensor)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2655,7 +2680,7 @@ class ArmNegativeOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmNegativeOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = -inputs[0]
+        out_tensor = np.negative(inputs[0])
         self.set_out_tensor(out_tensor)
 
 
@@ -2693,27 +2718,32 @@ class ArmNMSOp(OpHasMethod, OpHasMultipleOutPorts, ArmOp):
             WARN('[Parser]: NMS (%s) inputs number error, not equal to 4!' % self.name)
         batch_size = inputs[0].shape[0]
         num_classes = inputs[1].shape[1]
-        out_tensor1 = np.random.ranf(
-            size=(batch_size, self.max_box_num, 4)).astype(np.float32)
-        out_tensor2 = np.random.ranf(
-            size=(batch_size, num_classes)).astype(np.int32)
-        out_tensor3 = np.random.ranf(
-            size=(batch_size, self.max_box_num)).astype(np.float32)
-        out_tensor4 = np.random.ranf(
-            size=(batch_size, self.max_box_num)).astype(np.int32)
+        out_tensor1 = np.empty(
+            (batch_size, self.max_box_num, 4), dtype=np.float32)
+        out_tensor2 = np.zeros((batch_size, num_classes), dtype=np.int32)
+        out_tensor3 = np.empty(
+            (batch_size, self.max_box_num), dtype=np.float32)
+        out_tensor4 = np.zeros((batch_size, self.max_box_num), dtype=np.int32)
         out_tensor_list = [out_tensor1, out_tensor2, out_tensor3, out_tensor4]
         self.set_out_tensor(out_tensor_list)
 
     def write_attrs(self, txt_file):
         ret = super(ArmNMSOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('image_width=%d\n' % self.image_width)
-            txt_file.write('image_height=%d\n' % self.image_height)
-            txt_file.write('center_point_box=%d\n' % self.center_point_box)
-            txt_file.write('max_output_size=%d\n' % self.max_box_num)
-            txt_file.write('iou_threshold=%f\n' % self.iou_threshold)
-            txt_file.write('score_threshold=%f\n' % self.score_threshold)
-            txt_file.write('soft_nms_sigma=%f\n' % self.soft_nms_sigma)
+            txt_file.write('image_width=%d\n'
+                           'image_height=%d\n'
+                           'center_point_box=%d\n'
+                           'max_output_size=%d\n'
+                           'iou_threshold=%f\n'
+                           'score_threshold=%f\n'
+                           'soft_nms_sigma=%f\n'
+                           % (self.image_width,
+                              self.image_height,
+                              self.center_point_box,
+                              self.max_box_num,
+                              self.iou_threshold,
+                              self.score_threshold,
+                              self.soft_nms_sigma))
         return ret
 
 
@@ -2725,9 +2755,17 @@ class ArmNormalizationOp(OpHasMethod, OpHasAxis, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmNormalizationOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        ord = 1 if self.method == 'L1' else 2
-        out_tensor = inputs[0] / \
-            np.linalg.norm(inputs[0], ord=ord, axis=self.axis, keepdims=True)
+        if self.method == 'L1':
+            abs_tensor = np.abs(inputs[0])
+            norm = np.sum(abs_tensor, axis=self.axis, keepdims=True)
+            if abs_tensor.dtype.kind == 'f':
+                # Reuse the buffer of abs(x) as the output buffer.
+                out_tensor = np.divide(inputs[0], norm, out=abs_tensor)
+            else:
+                out_tensor = inputs[0] / norm
+        else:
+            norm = np.sqrt(OpHasAxis.reduce_sum_square(inputs[0], self.axis))
+            out_tensor = inputs[0] / norm
         self.set_out_tensor(out_tensor)
 
 
@@ -2753,14 +2791,15 @@ class ArmOneHotOp(OpHasOneOutPort, OpHasAxis, ArmOp):
         super(ArmOneHotOp, self).infer_shape()
         inputs = self.get_input_tensors()
         indices = inputs[0].astype(np.int64)
-        reps = [1] * (len(indices.shape) + 1)
-        reps[self.axis] = self.depth
-        tiled_indices = np.tile(np.expand_dims(indices, axis=self.axis), reps)
-        out_tensor = (np.ones_like(tiled_indices) *
-                      self.values[1]).astype(self.values.dtype)
-        off_mask = np.logical_and(
-            tiled_indices >= -self.depth, tiled_indices < self.depth - 1)
-        out_tensor[off_mask] = self.values[0]
+        axis = self.axis if self.axis >= 0 else self.axis + len(indices.shape) + 1
+        out_shape = list(indices.shape)
+        out_shape.insert(axis, self.depth)
+        out_tensor = np.full(out_shape, self.values[0], dtype=self.values.dtype)
+        valid_mask = np.logical_and(
+            indices >= -self.depth, indices < self.depth)
+        on_positions = list(np.nonzero(valid_mask))
+        on_positions.insert(axis, np.mod(indices[valid_mask], self.depth))
+        out_tensor[tuple(on_positions)] = self.values[1]
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2797,8 +2836,16 @@ class ArmPadOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmPadOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.pad(inputs[0], ArmPadOp.convert_pads_to_tf(
-            self.pads), mode=self.mode)
+        tf_pads = ArmPadOp.convert_pads_to_tf(self.pads).tolist()
+        if self.mode == 'constant' and all(p >= 0 for p in self.pads):
+            out_shape = [s + begin + end for s,
+                         (begin, end) in zip(inputs[0].shape, tf_pads)]
+            out_tensor = np.full(
+                out_shape, self.constant_value, dtype=inputs[0].dtype)
+            out_tensor[tuple(slice(begin, begin + s) for s, (begin, _) in zip(
+                inputs[0].shape, tf_pads))] = inputs[0]
+        else:
+            out_tensor = np.pad(inputs[0], tf_pads, mode=self.mode)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2882,18 +2929,17 @@ class ArmPoolingOp(OpHasMethod, OpHasPaddingStrides, OpHasOneOutPort, ArmOp):
                                                  self.auto_pad,
                                                  dilations=self.dilations,
                                                  ceil_mode=self.ceil_mode)
-        out_tensor = np.random.ranf(
-            [batch] + out_shape + [channel]).astype(inputs[0].dtype)
+        out_tensor = np.empty(
+            [batch] + out_shape + [channel], dtype=inputs[0].dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmPoolingOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('ceil_mode=%s\n' %
-                           str(bool(self.ceil_mode)).lower())
+            attrs_str = 'ceil_mode=%s\n' % str(bool(self.ceil_mode)).lower()
             if self.method == 'AVG':
-                txt_file.write('count_include_pad=%s\n' %
-                               str(bool(self.count_include_pad)).lower())
+                attrs_str += 'count_include_pad=%s\n' % str(bool(self.count_include_pad)).lower()
+            txt_file.write(attrs_str)
         return ret
 
 
@@ -2917,32 +2963,17 @@ class ArmPooling3DOp(OpHasMethod, OpHasPaddingStrides, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmPooling3DOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        input_tensor = torch.from_numpy(inputs[0]).permute(0, 4, 1, 2, 3)
-        input_tensor = torch.nn.functional.pad(
-            input_tensor, self.torch_pads, mode='constant', value=0)
-        if self.method == 'AVG':
-            out_tensor = torch.nn.functional.avg_pool3d(input_tensor,
-                                                        kernel_size=tuple(
-                                                            self.kernel_shape),
-                                                        stride=tuple(
-                                                            self.strides),
-                                                        ceil_mode=bool(
-                                                            self.ceil_mode),
-                                                        count_include_pad=bool(
-                                                            self.count_include_pad)
-                                                        ).numpy()
-        else:
-            out_tensor = torch.nn.functional.max_pool3d(input_tensor,
-                                                        kernel_size=tuple(
-                                                            self.kernel_shape),
-                                                        stride=tuple(
-                                                            self.strides),
-                                                        dilation=tuple(
-                                                            self.dilations),
-                                                        ceil_mode=bool(
-                                                            self.ceil_mode)
-                                                        ).numpy()
-        out_tensor = np.transpose(out_tensor, [0, 2, 3, 4, 1])
+        batch, spatial_shape, channel = inputs[0].shape[0], inputs[0].shape[1:-
+                                                                            1], inputs[0].shape[-1]
+        out_shape = BaseOnnxPoolOp.cal_out_shape(spatial_shape,
+                                                 self.pads,
+                                                 self.strides,
+                                                 self.kernel_shape,
+                                                 self.auto_pad,
+                                                 dilations=self.dilations,
+                                                 ceil_mode=self.ceil_mode)
+        out_tensor = np.empty(
+            [batch] + out_shape + [channel], dtype=inputs[0].dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -2981,18 +3012,19 @@ class ArmPostNMS1Op(OpHasMultipleOutPorts, ArmOp):
         super(ArmPostNMS1Op, self).infer_shape()
         inputs = self.get_input_tensors()
         batch_size = inputs[0].shape[0]
-        out_tensor1 = np.random.ranf(
-            size=(batch_size, self.proposal_cnt, 4)).astype(np.float32)
-        out_tensor2 = np.random.ranf(
-            size=(batch_size, self.proposal_cnt, 4)).astype(np.float32)
+        out_tensor1 = _shape_stub((batch_size, self.proposal_cnt, 4), np.float32)
+        out_tensor2 = _shape_stub((batch_size, self.proposal_cnt, 4), np.float32)
         self.set_out_tensor([out_tensor1, out_tensor2])
 
     def write_attrs(self, txt_file):
         ret = super(ArmPostNMS1Op, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('image_width=%d\n' % self.image_width)
-            txt_file.write('image_height=%d\n' % self.image_height)
-            txt_file.write('proposal_cnt=%d\n' % self.proposal_cnt)
+            txt_file.write('image_width=%d\n'
+                           'image_height=%d\n'
+                           'proposal_cnt=%d\n'
+                           % (self.image_width,
+                              self.image_height,
+                              self.proposal_cnt))
         return ret
 
 
@@ -3013,7 +3045,7 @@ class ArmPowOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmPowOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = tf.pow(*inputs).eval()
+        out_tensor = np.power(*inputs).astype(inputs[0].dtype, copy=False)
         self.set_out_tensor(out_tensor)
 
 
@@ -3025,7 +3057,7 @@ class ArmPreprocessOp(OpHasVariableOutPorts, ArmOp):
     def infer_shape(self):
         super(ArmPreprocessOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensors = [inp.copy() for inp in inputs]
+        out_tensors = list(inputs)
         self.set_out_tensor(out_tensors)
 
 
@@ -3057,24 +3089,24 @@ class ArmProposalOp(OpHasMultipleOutPorts, ArmOp):
         super(ArmProposalOp, self).infer_shape()
         inputs = self.get_input_tensors()
         batch_size = inputs[0].shape[0]
-        out_tensor1 = np.random.ranf(
-            size=(batch_size, self.max_box_num)).astype(np.float32)
-        out_tensor2 = np.random.ranf(
-            size=(batch_size, self.max_box_num, 4)).astype(np.float32)
-        out_tensor3 = np.random.ranf(
-            size=(batch_size, self.class_num)).astype(np.int32)
-        out_tensor4 = np.random.ranf(size=(batch_size, 1)).astype(np.int32)
+        out_tensor1 = _shape_stub((batch_size, self.max_box_num), np.float32)
+        out_tensor2 = _shape_stub((batch_size, self.max_box_num, 4), np.float32)
+        out_tensor3 = _shape_stub((batch_size, self.class_num), np.int32)
+        out_tensor4 = _shape_stub((batch_size, 1), np.int32)
         self.set_out_tensor(
             [out_tensor1, out_tensor2, out_tensor3, out_tensor4])
 
     def write_attrs(self, txt_file):
         ret = super(ArmProposalOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('width=%d\n' % self.width)
-            txt_file.write('height=%d\n' % self.height)
-            txt_file.write('score_threshold=%f\n' % self.score_threshold)
-            txt_file.write('scale_anchor=[%s]\n' %
-                           list_list_to_string(self.scale_anchor))
+            txt_file.write('width=%d\n'
+                           'height=%d\n'
+                           'score_threshold=%f\n'
+                           'scale_anchor=[%s]\n'
+                           % (self.width,
+                              self.height,
+                              self.score_threshold,
+                              list_list_to_string(self.scale_anchor)))
         return ret
 
 
@@ -3097,17 +3129,19 @@ class ArmPyramidROIAlignOp(OpHasOneOutPort, ArmOp):
             inputs) == 5, 'Inputs number of ArmPyramidROIAlignOp should be equal to 5!'
         roi_num = inputs[0].shape[1]
         channels = inputs[1].shape[-1]
-        out_tensor = np.random.ranf((roi_num,
-                                     self.resize_height,
-                                     self.resize_width,
-                                     channels)).astype(np.float32)
+        out_tensor = _shape_stub((roi_num,
+                                  self.resize_height,
+                                  self.resize_width,
+                                  channels), np.float32)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmPyramidROIAlignOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('resize_width=%d\n' % self.resize_width)
-            txt_file.write('resize_height=%d\n' % self.resize_height)
+            txt_file.write('resize_width=%d\n'
+                           'resize_height=%d\n'
+                           % (self.resize_width,
+                              self.resize_height))
         return ret
 
 
@@ -3121,7 +3155,7 @@ class ArmReduceOp(OpHasMethod, OpHasAxis, OpHasOneOutPort, ArmOp):
         'PROD': lambda x, y, z: np.prod(x, axis=y, keepdims=z),
         'SUM': lambda x, y, z: np.sum(x, axis=y, keepdims=z),
         'L1': lambda x, y, z: np.sum(np.abs(x), axis=y, keepdims=z),
-        'L2': lambda x, y, z: np.sqrt(np.sum(np.square(x), axis=y, keepdims=z)),
+        'L2': lambda x, y, z: np.sqrt(OpHasAxis.reduce_sum_square(x, list(y), keepdims=z)),
         'VARIANCE': lambda x, y, z: np.var(x, axis=y, keepdims=z),
         'UNBIASED_VARIANCE': lambda x, y, z: np.var(x, axis=y, keepdims=z, ddof=1),
     }
@@ -3159,7 +3193,7 @@ class ArmReciprocalOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmReciprocalOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.reciprocal(inputs[0]).astype(np.float32)
+        out_tensor = np.reciprocal(inputs[0]).astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
 
@@ -3185,17 +3219,20 @@ class ArmRefineDetDetectionOp(OpHasOneOutPort, ArmOp):
         super(ArmRefineDetDetectionOp, self).infer_shape()
         inputs = self.get_input_tensors()
         batch = inputs[0].shape[0]
-        out_tensor = np.random.ranf(
-            (batch, self.post_nms_topk, 4)).astype(np.float32)
+        out_tensor = _shape_stub((batch, self.post_nms_topk, 4), np.float32)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmRefineDetDetectionOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('obj_thresh=%f\n' % self.obj_thresh)
-            txt_file.write('conf_thresh=%f\n' % self.conf_thresh)
-            txt_file.write('pre_nms_topk=%d\n' % self.pre_nms_topk)
-            txt_file.write('post_nms_topk=%d\n' % self.post_nms_topk)
+            txt_file.write('obj_thresh=%f\n'
+                           'conf_thresh=%f\n'
+                           'pre_nms_topk=%d\n'
+                           'post_nms_topk=%d\n'
+                           % (self.obj_thresh,
+                              self.conf_thresh,
+                              self.pre_nms_topk,
+                              self.post_nms_topk))
         return ret
 
 
@@ -3222,15 +3259,11 @@ class ArmRegionOp(OpHasMultipleOutPorts, ArmOp):
         super(ArmRegionOp, self).infer_shape()
         inputs = self.get_input_tensors()
         batch_size = inputs[0].shape[0]
-        out_tensor1 = np.random.ranf(
-            size=(batch_size, self.max_box_num)).astype(np.float32)
-        out_tensor2 = np.random.ranf(
-            size=(batch_size, self.max_box_num, 4)).astype(np.float32)
-        out_tensor3 = np.random.ranf(
-            size=(batch_size, self.class_num)).astype(np.int32)
-        out_tensor4 = np.random.ranf(
-            size=(batch_size, self.class_num)).astype(np.int32)
-        out_tensor5 = np.random.ranf(size=(batch_size, 1)).astype(np.int32)
+        out_tensor1 = _shape_stub((batch_size, self.max_box_num), np.float32)
+        out_tensor2 = _shape_stub((batch_size, self.max_box_num, 4), np.float32)
+        out_tensor3 = _shape_stub((batch_size, self.class_num), np.int32)
+        out_tensor4 = _shape_stub((batch_size, self.class_num), np.int32)
+        out_tensor5 = _shape_stub((batch_size, 1), np.int32)
         out_tensor_list = [out_tensor1, out_tensor2,
                            out_tensor3, out_tensor4, out_tensor5]
         self.set_out_tensor(out_tensor_list)
@@ -3238,27 +3271,35 @@ class ArmRegionOp(OpHasMultipleOutPorts, ArmOp):
     def write_attrs(self, txt_file):
         ret = super(ArmRegionOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('grid_width=%d\n' % self.grid_width)
-            txt_file.write('grid_height=%d\n' % self.grid_height)
-            txt_file.write('box_per_grid=%d\n' % self.box_per_grid)
-            txt_file.write('max_box_num=%d\n' % self.max_box_num)
-            txt_file.write('class_num=%d\n' % self.class_num)
-            txt_file.write('obj_thresh=%f\n' % self.obj_threshold)
-            txt_file.write('anchors=[%s]\n' %
-                           list_list_to_string(self.anchors))
-            txt_file.write('grid_compensate=%s\n' %
-                           str(self.grid_compensate).lower())
+            txt_file.write('grid_width=%d\n'
+                           'grid_height=%d\n'
+                           'box_per_grid=%d\n'
+                           'max_box_num=%d\n'
+                           'class_num=%d\n'
+                           'obj_thresh=%f\n'
+                           'anchors=[%s]\n'
+                           'grid_compensate=%s\n'
+                           % (self.grid_width,
+                              self.grid_height,
+                              self.box_per_grid,
+                              self.max_box_num,
+                              self.class_num,
+                              self.obj_threshold,
+                              list_list_to_string(self.anchors),
+                              str(self.grid_compensate).lower()))
         return ret
 
 
 class ArmRegionFuseOp(OpHasMultipleOutPorts, ArmOp):
+    CAST_IN_PORTS = {k: 'float32' if k < 4 else 'int32' for k in range(10)}
+
     @classmethod
     def num_in_ports(cls):
         return 10
 
     @classmethod
     def cast_in_ports(cls):
-        return {k: 'float32' if k < 4 else 'int32' for k in range(ArmRegionFuseOp.num_in_ports())}
+        return ArmRegionFuseOp.CAST_IN_PORTS
 
     @classmethod
     def attributes(cls):
@@ -3274,11 +3315,11 @@ class ArmRegionFuseOp(OpHasMultipleOutPorts, ArmOp):
         super(ArmRegionFuseOp, self).infer_shape()
         inputs = self.get_input_tensors()
         batch_size = inputs[0].shape[0]
-        out1 = np.random.ranf((batch_size, 10000)).astype(np.float32)
-        out2 = np.random.ranf((batch_size, 10000, 4)).astype(np.float32)
-        out3 = np.random.ranf((batch_size, self.class_num)).astype(np.int32)
-        out4 = np.random.ranf((batch_size, self.class_num)).astype(np.int32)
-        out5 = np.random.ranf((batch_size, 1)).astype(np.int32)
+        out1 = _shape_stub((batch_size, 10000), np.float32)
+        out2 = _shape_stub((batch_size, 10000, 4), np.float32)
+        out3 = _shape_stub((batch_size, self.class_num), np.int32)
+        out4 = _shape_stub((batch_size, self.class_num), np.int32)
+        out5 = _shape_stub((batch_size, 1), np.int32)
         self.set_out_tensor([out1, out2, out3, out4, out5])
 
     def write_attrs(self, txt_file):
@@ -3301,18 +3342,21 @@ class ArmRepeatOp(OpHasAxis, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmRepeatOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.repeat(*inputs, axis=self.axis)
-        out_shape = list(out_tensor.shape)
-        if out_shape[self.axis] > self.max_dim:
-            obj = tuple(slice(0, e if i != self.axis else self.max_dim)
-                        for (i, e) in enumerate(out_shape))
-            out_tensor = out_tensor[obj]
-        elif out_shape[self.axis] < self.max_dim:
-            shape_diff = self.max_dim - out_shape[self.axis]
-            zeros_shape = copy.deepcopy(out_shape)
-            zeros_shape[self.axis] = shape_diff
-            zeros = np.zeros(zeros_shape, inputs[0].dtype)
-            out_tensor = np.concatenate([out_tensor, zeros], axis=self.axis)
+        axis = OpHasAxis.make_axes_non_negative(self.axis, len(inputs[0].shape))
+        input_dim = inputs[0].shape[axis]
+        repeats = np.broadcast_to(np.reshape(inputs[1], [-1]), [input_dim])
+        # Only repeat the leading slices that are needed to fill max_dim.
+        valid_num = min(int(np.searchsorted(np.cumsum(repeats), self.max_dim)) + 1, input_dim)
+        repeated = np.repeat(np.take(inputs[0], np.arange(valid_num), axis=axis),
+                             repeats[:valid_num],
+                             axis=axis)
+        repeated_dim = min(repeated.shape[axis], self.max_dim)
+        out_shape = list(inputs[0].shape)
+        out_shape[axis] = self.max_dim
+        out_tensor = np.zeros(out_shape, inputs[0].dtype)
+        obj = tuple(slice(0, e if i != axis else repeated_dim)
+                    for (i, e) in enumerate(out_shape))
+        out_tensor[obj] = repeated[obj]
         self.set_out_tensor(out_tensor)
 
 
@@ -3367,27 +3411,28 @@ class ArmResizeOp(OpHasMethod, OpHasOneOutPort, ArmOp):
             spatial_shape = inputs[0].shape[1:-1]
             size = np.floor(np.array(spatial_shape) *
                             np.array(self.factors)).astype(np.int32).tolist()
-        perm = [0, len(inputs[0].shape)-1] + \
-            list(range(1, len(inputs[0].shape)-1))
-        inverse_perm = Op.cal_inverse_perm(perm)
-        # torch.nn.functional.interpolate doesn't support int(not implemented)
-        out_tensor = torch.nn.functional.interpolate(torch.from_numpy(np.transpose(inputs[0].astype(np.float32), perm)),
-                                                     size=tuple(size),
-                                                     mode='nearest'
-                                                     ).numpy()
-        out_tensor = np.transpose(out_tensor, inverse_perm)
+        # Same as torch.nn.functional.interpolate(mode='nearest') on NCHW input: the source
+        # index of each spatial output index i is min(floor(i * in_size / out_size), in_size - 1).
+        # Index the NHWC input directly so that no layout transpose is needed.
+        spatial_indices = []
+        for in_size, out_size in zip(inputs[0].shape[1:-1], size):
+            scale = np.float32(in_size) / np.float32(out_size)
+            src_index = np.floor(np.arange(out_size, dtype=np.float32) * scale).astype(np.int64)
+            spatial_indices.append(np.minimum(src_index, in_size - 1))
+        out_tensor = inputs[0].astype(np.float32, copy=False)[np.ix_(
+            np.arange(inputs[0].shape[0]), *spatial_indices, np.arange(inputs[0].shape[-1]))]
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmResizeOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('ratio_x=%.8f\n' % self.factors[-1])
-            txt_file.write('ratio_y=%.8f\n' % self.factors[-2])
+            attrs_str = 'ratio_x=%.8f\nratio_y=%.8f\n' % (self.factors[-1], self.factors[-2])
             if len(self.factors) == 3:
-                txt_file.write('ratio_z=%.8f\n' % self.factors[-3])
-            txt_file.write('mode=%s\n' % self.mode.upper())
+                attrs_str += 'ratio_z=%.8f\n' % self.factors[-3]
+            attrs_str += 'mode=%s\n' % self.mode.upper()
             if self.method.upper() == 'NEAREST':
-                txt_file.write('nearest_mode=%s\n' % self.nearest_mode.upper())
+                attrs_str += 'nearest_mode=%s\n' % self.nearest_mode.upper()
+            txt_file.write(attrs_str)
         return ret
 
 
@@ -3416,15 +3461,16 @@ class ArmReverseSequenceOp(OpHasOneOutPort, ArmOp):
         inputs = self.get_input_tensors()
         if len(inputs) != 2:
             WARN('[Parser]: Invalid inputs number of ReverseSequence (%s)!' % self.name)
-        out_tensor = tf.reverse(inputs[0], axis=np.array(
-            [self.time_axis], np.int64)).eval()
+        out_tensor = np.flip(inputs[0], axis=self.time_axis)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmReverseSequenceOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('batch_axis=%d\n' % self.batch_axis)
-            txt_file.write('time_axis=%d\n' % self.time_axis)
+            txt_file.write('batch_axis=%d\n'
+                           'time_axis=%d\n'
+                           % (self.batch_axis,
+                              self.time_axis))
         return ret
 
 
@@ -3456,21 +3502,20 @@ class ArmRoiAlignOp(OpHasMethod, OpHasOneOutPort, ArmOp):
         inputs = self.get_input_tensors()
         roi_num = inputs[1].shape[0]
         channels = inputs[0].shape[-1]
-        out_tensor = np.random.ranf(
-            (roi_num, *self.pooled_shape, channels)).astype(np.float32)
+        out_tensor = _shape_stub((roi_num, *self.pooled_shape, channels), np.float32)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmRoiAlignOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('pooled_shape=[%s]\n' %
-                           list_list_to_string(self.pooled_shape))
-            txt_file.write(
-                'spatial_scale_value=[%s]\n' % list_list_to_string(self.spatial_scale))
-            txt_file.write('sample=[%s]\n' %
-                           list_list_to_string(self.sample_ratio))
-            txt_file.write('coordinate_transformation_mode=%s\n' %
-                           self.coordinate_transformation_mode.upper())
+            txt_file.write('pooled_shape=[%s]\n'
+                           'spatial_scale_value=[%s]\n'
+                           'sample=[%s]\n'
+                           'coordinate_transformation_mode=%s\n'
+                           % (list_list_to_string(self.pooled_shape),
+                              list_list_to_string(self.spatial_scale),
+                              list_list_to_string(self.sample_ratio),
+                              self.coordinate_transformation_mode.upper()))
         return ret
 
 
@@ -3482,7 +3527,7 @@ class ArmRoundOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmRoundOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.round(inputs[0]).astype(np.float32)
+        out_tensor = np.round(inputs[0]).astype(np.float32, copy=False)
         self.set_out_tensor(out_tensor)
 
 
@@ -3494,8 +3539,9 @@ class ArmRsqrtOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmRsqrtOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensors = np.sqrt(inputs[0])
-        self.set_out_tensor(out_tensors)
+        out_tensor = np.sqrt(inputs[0])
+        np.reciprocal(out_tensor, out=out_tensor)
+        self.set_out_tensor(out_tensor)
 
 
 class ArmScatterNDOp(OpHasOneOutPort, ArmOp):
@@ -3521,15 +3567,29 @@ class ArmScatterNDOp(OpHasOneOutPort, ArmOp):
         inputs = self.get_input_tensors()
         data, indices, updates = inputs
         out_tensor = np.copy(data)
-        update_indices = indices.shape[:-1]
-        for idx in np.ndindex(update_indices):
-            index = tuple(indices[idx])
-            if self.reduction == 'mul':
-                out_tensor[index] *= updates[idx]
-            elif self.reduction == 'add':
-                out_tensor[index] += updates[idx]
-            else:
-                out_tensor[index] = updates[idx]
+        index_depth = indices.shape[-1]
+        slice_shape = list(data.shape[index_depth:])
+        index_dims = np.array(data.shape[:index_depth])
+        multi_indices = np.reshape(indices, [-1, index_depth])
+        multi_indices = np.where(multi_indices < 0, multi_indices + index_dims, multi_indices)
+        flat_indices = np.ravel_multi_index(tuple(multi_indices.T), data.shape[:index_depth])
+        flat_updates = np.reshape(updates, [-1] + slice_shape)
+        flat_out = np.reshape(out_tensor, [-1] + slice_shape)
+        if self.reduction in ('MUL', 'ADD') and flat_indices.size > 0:
+            # Group the updates of the same index together and reduce each group at once,
+            # which is much faster than the unbuffered ufunc.at when indices collide.
+            reduce_func = np.multiply if self.reduction == 'MUL' else np.add
+            order = np.argsort(flat_indices, kind='stable')
+            sorted_indices = flat_indices[order]
+            starts = np.flatnonzero(np.concatenate(
+                [[True], sorted_indices[1:] != sorted_indices[:-1]]))
+            reduced_updates = reduce_func.reduceat(
+                flat_updates[order], starts, axis=0)
+            unique_indices = sorted_indices[starts]
+            flat_out[unique_indices] = reduce_func(
+                flat_out[unique_indices], reduced_updates)
+        else:
+            flat_out[flat_indices] = flat_updates
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -3561,21 +3621,18 @@ class ArmScatterElementsOp(OpHasOneOutPort, OpHasAxis, ArmOp):
         super(ArmScatterElementsOp, self).infer_shape()
         inputs = self.get_input_tensors()
         data, indices, updates = inputs
-        from .onnx_ops.array_ops import GatherElementsOp
-        indices = GatherElementsOp.make_indices_non_negative(
-            indices, inputs[0].shape[self.axis])
-        data_torch = torch.from_numpy(data)
-        index_torch = torch.from_numpy(np.array(indices).astype(np.int64))
-        update_torch = torch.from_numpy(updates)
+        # Negative indices are resolved by numpy indexing itself, so indices is used as it is.
+        axis = OpHasAxis.make_axes_non_negative(self.axis, len(data.shape))
+        full_indices = list(np.indices(indices.shape, sparse=True))
+        full_indices[axis] = indices
+        full_indices = tuple(full_indices)
+        out_tensor = np.copy(data)
         if self.reduction == 'NONE':
-            out_tensor = torch.Tensor.scatter_(
-                data_torch, src=update_torch, dim=self.axis, index=index_torch).numpy()
+            out_tensor[full_indices] = updates
         elif self.reduction == 'ADD':
-            out_tensor = torch.Tensor.scatter_(
-                data_torch, src=update_torch, dim=self.axis, index=index_torch, reduce='add').numpy()
+            np.add.at(out_tensor, full_indices, updates)
         else:
-            out_tensor = torch.Tensor.scatter_(
-                data_torch, src=update_torch, dim=self.axis, index=index_torch, reduce='multiply').numpy()
+            np.multiply.at(out_tensor, full_indices, updates)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -3592,6 +3649,12 @@ class ArmSegmentReduceOp(OpHasMethod, OpHasOneOutPort, ArmOp):
                 'MAX': tf.math.segment_max,
                 'MEAN': tf.math.segment_mean,
                 }
+    NP_FUNC_MAP = {'SUM': np.add,
+                   'PROD': np.multiply,
+                   'MIN': np.minimum,
+                   'MAX': np.maximum,
+                   'MEAN': np.add,
+                   }
 
     @classmethod
     def attributes(cls):
@@ -3613,7 +3676,23 @@ class ArmSegmentReduceOp(OpHasMethod, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmSegmentReduceOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = ArmSegmentReduceOp.FUNC_MAP[self.method](*inputs).eval()
+        data, segment_ids = inputs
+        if segment_ids.size == 0 or np.any(np.diff(segment_ids) < 0):
+            out_tensor = ArmSegmentReduceOp.FUNC_MAP[self.method](*inputs).eval()
+        else:
+            # segment_ids are sorted, so every segment is a contiguous run of rows.
+            starts = np.concatenate(
+                [[0], np.flatnonzero(np.diff(segment_ids)) + 1])
+            reduced = ArmSegmentReduceOp.NP_FUNC_MAP[self.method].reduceat(
+                data, starts, axis=0)
+            if self.method == 'MEAN':
+                counts = np.diff(np.append(starts, segment_ids.size))
+                reduced = reduced / \
+                    np.reshape(counts, [-1] + [1] * (len(data.shape) - 1))
+            out_tensor = np.full([int(segment_ids[-1]) + 1] + list(data.shape[1:]),
+                                 1 if self.method == 'PROD' else 0,
+                                 dtype=data.dtype)
+            out_tensor[segment_ids[starts]] = reduced
         self.set_out_tensor(out_tensor)
 
 
@@ -3649,7 +3728,7 @@ class ArmSinhOp(LayoutUnawareOp, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmSinhOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = tf.sinh(inputs[0]).eval()
+        out_tensor = np.sinh(inputs[0])
         self.set_out_tensor(out_tensor)
 
 
@@ -3676,9 +3755,12 @@ class ArmSliceOp(OpHasOneOutPort, ArmOp):
     def write_attrs(self, txt_file):
         ret = super(ArmSliceOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('begin=[%s]\n' % list_list_to_string(self.starts))
-            txt_file.write('end=[%s]\n' % list_list_to_string(self.ends))
-            txt_file.write('strides=[%s]\n' % list_list_to_string(self.steps))
+            txt_file.write('begin=[%s]\n'
+                           'end=[%s]\n'
+                           'strides=[%s]\n'
+                           % (list_list_to_string(self.starts),
+                              list_list_to_string(self.ends),
+                              list_list_to_string(self.steps)))
         return ret
 
 
@@ -3699,11 +3781,15 @@ class ArmSoftmaxOp(OpHasAxis, OpHasOneOutPort, ArmOp):
     def infer_shape(self, input_tensor: np.ndarray = None):
         super(ArmSoftmaxOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = tf.nn.softmax(inputs[0], axis=self.axis).eval()
+        out_tensor = np.exp(inputs[0] - np.max(inputs[0], axis=self.axis, keepdims=True))
+        out_tensor /= np.sum(out_tensor, axis=self.axis, keepdims=True)
         self.set_out_tensor(out_tensor)
 
 
 class ArmSpaceToBatchOp(OpHasOneOutPort, ArmOp):
+    # Indices of pad_top, pad_bottom, pad_left and pad_right in pads of each supported size.
+    SPATIAL_PAD_INDICES = {4: (0, 2, 1, 3), 6: (0, 3, 1, 4), 8: (1, 5, 2, 6)}
+
     @classmethod
     def attributes(cls):
         return {'block_size_x': {'type': AttrType.INT, 'default': 2},
@@ -3716,70 +3802,39 @@ class ArmSpaceToBatchOp(OpHasOneOutPort, ArmOp):
         self.update_attributes(ArmSpaceToBatchOp, attr_dict)
         assert self.check_required(), 'ArmSpaceToBatchOp is missing a required parameter.'
 
-    def __getattr__(self, item):
-        ret = None
-        try:
-            pad_size = len(self._attr['pads'].value)
-            if item == 'pad_top':
-                if pad_size in (4, 6):
-                    ret = self.pads[0]
-                elif pad_size == 8:
-                    ret = self.pads[1]
-                else:
-                    ERROR('[Parser]: Node(%s) pads size not supported!' %
-                          self.name)
-            elif item == 'pad_bottom':
-                if pad_size == 4:
-                    ret = self.pads[2]
-                elif pad_size == 6:
-                    ret = self.pads[3]
-                elif pad_size == 8:
-                    ret = self.pads[5]
-                else:
-                    ERROR('[Parser]: Node(%s) pads size not supported!' %
-                          self.name)
-            elif item == 'pad_left':
-                if pad_size in (4, 6):
-                    ret = self.pads[1]
-                elif pad_size == 8:
-                    ret = self.pads[2]
-                else:
-                    ERROR('[Parser]: Node(%s) pads size not supported!' %
-                          self.name)
-            elif item == 'pad_right':
-                if pad_size == 4:
-                    ret = self.pads[3]
-                elif pad_size == 6:
-                    ret = self.pads[4]
-                elif pad_size == 8:
-                    ret = self.pads[6]
-                else:
-                    ERROR('[Parser]: Node(%s) pads size not supported!' %
-                          self.name)
-        except:
-            ret = None
-        if ret is None:
-            ret = super(ArmSpaceToBatchOp, self).__getattr__(item)
-        return ret
+    def cal_spatial_pads(self):
+        '''Return [pad_top, pad_bottom, pad_left, pad_right] from pads.'''
+        pad_indices = ArmSpaceToBatchOp.SPATIAL_PAD_INDICES.get(len(self.pads), None)
+        if pad_indices is None:
+            ERROR('[Parser]: Node(%s) pads size not supported!' % self.name)
+            return [None] * 4
+        return [self.pads[i] for i in pad_indices]
 
     def infer_shape(self):
         super(ArmSpaceToBatchOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = tf.space_to_batch_nd(inputs[0],
-                                          block_shape=np.array(
-                                              [self.block_size_y, self.block_size_x], dtype=np.int64),
-                                          paddings=OpHasPaddingStrides.onnx_to_tf(self.pads)[1:3, :]).eval()
+        paddings = OpHasPaddingStrides.onnx_to_tf(self.pads)[1:3, :]
+        padded = np.pad(inputs[0], [[0, 0]] + paddings.tolist() + [[0, 0]], mode='constant')
+        n, h, w, c = padded.shape
+        block_y, block_x = self.block_size_y, self.block_size_x
+        out_tensor = np.reshape(padded, [n, h // block_y, block_y, w // block_x, block_x, c])
+        out_tensor = np.transpose(out_tensor, [2, 4, 0, 1, 3, 5])
+        out_tensor = np.reshape(out_tensor, [block_y * block_x * n, h // block_y, w // block_x, c])
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmSpaceToBatchOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('block_size_x=%d\n' % self.block_size_x)
-            txt_file.write('block_size_y=%d\n' % self.block_size_y)
-            txt_file.write('pad_left=%d\n' % self.pad_left)
-            txt_file.write('pad_right=%d\n' % self.pad_right)
-            txt_file.write('pad_top=%d\n' % self.pad_top)
-            txt_file.write('pad_bottom=%d\n' % self.pad_bottom)
+            pad_top, pad_bottom, pad_left, pad_right = self.cal_spatial_pads()
+            txt_file.write('block_size_x=%d\n'
+                           'block_size_y=%d\n'
+                           'pad_left=%d\n'
+                           'pad_right=%d\n'
+                           'pad_top=%d\n'
+                           'pad_bottom=%d\n'
+                           % (self.block_size_x, self.block_size_y,
+                              pad_left, pad_right,
+                              pad_top, pad_bottom))
         return ret
 
 
@@ -3796,14 +3851,18 @@ class ArmSpaceToDepthOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmSpaceToDepthOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = tf.nn.space_to_depth(inputs[0], self.blocksize).eval()
+        n, h, w, c = inputs[0].shape
+        block = self.blocksize
+        out_tensor = np.reshape(inputs[0], [n, h // block, block, w // block, block, c])
+        out_tensor = np.transpose(out_tensor, [0, 1, 3, 2, 4, 5])
+        out_tensor = np.reshape(out_tensor, [n, h // block, w // block, block * block * c])
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmSpaceToDepthOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('block_size_x=%d\n' % self.blocksize)
-            txt_file.write('block_size_y=%d\n' % self.blocksize)
+            txt_file.write('block_size_x=%d\nblock_size_y=%d\n' %
+                           (self.blocksize, self.blocksize))
         return ret
 
 
@@ -3818,23 +3877,12 @@ class ArmSplitOp(OpHasAxis, OpHasMultipleOutPorts, ArmOp):
         self.update_attributes(ArmSplitOp, attr_dict)
         assert self.check_required(), 'ArmSplitOp is missing a required parameter.'
 
-    def __getattr__(self, item):
-        ret = None
-        try:
-            if item == 'splits':
-                ret = self.__dict__['_attr'][item].value if self.__dict__[
-                    '_attr'][item].value is not None else []
-        except:
-            ret = None
-        if ret is None:
-            ret = super(ArmSplitOp, self).__getattr__(item)
-        return ret
-
     def infer_shape(self):
         super(ArmSplitOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensors = tf.split(inputs[0], np.array(self.split), axis=self.axis)
-        out_tensors = [o.eval() for o in out_tensors]
+        assert sum(self.split) == inputs[0].shape[self.axis], \
+            'The sum of split is not equal to the input dim at axis in ArmSplitOp(%s).' % self.name
+        out_tensors = np.split(inputs[0], np.cumsum(self.split)[:-1], axis=self.axis)
         self.set_out_tensor(out_tensors)
 
     def write_attrs(self, txt_file):
@@ -3876,7 +3924,8 @@ class ArmSquaredDifferenceOp(OpNeedBroadcast, OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmSquaredDifferenceOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.power(np.subtract(*inputs), 2)
+        out_tensor = np.subtract(*inputs)
+        np.multiply(out_tensor, out_tensor, out=out_tensor)
         self.set_out_tensor(out_tensor)
 
 
@@ -3908,7 +3957,16 @@ class ArmTileOp(OpHasOneOutPort, ArmOp):
         if len(inputs[0].shape) != len(self.reps):
             WARN(
                 '[Parser]: Input shape of ArmTile(%s) does not comply with repeats!' % self.name)
-        out_tensors = np.tile(inputs[0], self.reps)
+            out_tensors = np.tile(inputs[0], self.reps)
+        else:
+            # Broadcast the input from (1, d0, 1, d1, ...) into a (r0, d0, r1, d1, ...) buffer and
+            # merge each (ri, di) pair, which fills the tiled output in a single copy.
+            expanded_shape = [v for d in inputs[0].shape for v in (1, d)]
+            broadcast_shape = [v for r, d in zip(self.reps, inputs[0].shape) for v in (r, d)]
+            out_shape = [r * d for r, d in zip(self.reps, inputs[0].shape)]
+            out_tensors = np.empty(broadcast_shape, dtype=inputs[0].dtype)
+            np.copyto(out_tensors, np.reshape(inputs[0], expanded_shape))
+            out_tensors = np.reshape(out_tensors, out_shape)
         self.set_out_tensor(out_tensors)
 
     def write_attrs(self, txt_file):
@@ -3939,19 +3997,30 @@ class ArmTopKOp(OpHasAxis, OpHasMultipleOutPorts, ArmOp):
     def infer_shape(self):
         super(ArmTopKOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        input_tensor = torch.from_numpy(inputs[0])
-        out_tensor_list = torch.topk(input_tensor, self.k, dim=self.axis, largest=bool(
-            self.largest), sorted=bool(self.sorted))
-        out_tensor_list = [ot.numpy() for ot in out_tensor_list]
-        out_tensor_list[1] = out_tensor_list[1].astype(np.int32)
-        self.set_out_tensor(out_tensor_list)
+        sort_key = np.negative(inputs[0]) if self.largest else inputs[0]
+        if self.k < inputs[0].shape[self.axis]:
+            # Partial sort: only the k selected elements are ordered below.
+            indices = np.argpartition(sort_key, self.k - 1, axis=self.axis)
+            indices = np.take(indices, np.arange(self.k), axis=self.axis)
+        else:
+            indices = np.argsort(sort_key, axis=self.axis, kind='stable')
+        if self.sorted:
+            order = np.argsort(np.take_along_axis(sort_key, indices, axis=self.axis),
+                               axis=self.axis,
+                               kind='stable')
+            indices = np.take_along_axis(indices, order, axis=self.axis)
+        values = np.take_along_axis(inputs[0], indices, axis=self.axis)
+        self.set_out_tensor([values, indices.astype(np.int32)])
 
     def write_attrs(self, txt_file):
         ret = super(ArmTopKOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('k=%d\n' % self.k)
-            txt_file.write('sorted=%s\n' % str(bool(self.sorted)).lower())
-            txt_file.write('largest=%s\n' % str(bool(self.largest)).lower())
+            txt_file.write('k=%d\n'
+                           'sorted=%s\n'
+                           'largest=%s\n'
+                           % (self.k,
+                              str(bool(self.sorted)).lower(),
+                              str(bool(self.largest)).lower()))
         return ret
 
 
@@ -3960,9 +4029,7 @@ class ArmTransposeOp(OpHasOneOutPort, ArmOp):
     def cal_merged_perm(perm1, perm2):
         assert len(perm1) == len(
             perm2), 'The length of perm1 is not equal to the length of perm2 in ArmTransposeOp.'
-        base = np.array(list(range(len(perm1))), np.int64)
-        final = base[np.array(perm1)][np.array(perm2)]
-        return final.tolist()
+        return [int(perm1[p]) for p in perm2]
 
     @classmethod
     def attributes(cls):
@@ -3976,8 +4043,12 @@ class ArmTransposeOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmTransposeOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.transpose(
-            inputs[0], axes=self.perm if self.perm else None)
+        if self.perm and self.perm == list(range(len(self.perm))):
+            # Identity perm: the output is the input itself
+            out_tensor = inputs[0]
+        else:
+            out_tensor = np.transpose(
+                inputs[0], axes=self.perm if self.perm else None)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
@@ -4011,14 +4082,14 @@ class ArmUpsampleByIndexOp(OpHasOneOutPort, ArmOp):
         out_shape = np.array(inputs[0].shape, np.int64) * \
             np.array(multiplier, np.int64)
         self.shape = out_shape.tolist()
-        out_tensor = np.random.ranf(self.shape).astype(inputs[0].dtype)
+        out_tensor = _shape_stub(self.shape, inputs[0].dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmUpsampleByIndexOp, self).write_attrs(txt_file)
         if ret:
-            txt_file.write('flatten_dim=%s\n' % self.flatten_dim)
-            txt_file.write('shape=[%s]\n' % list_list_to_string(self.shape))
+            txt_file.write('flatten_dim=%s\nshape=[%s]\n' %
+                           (self.flatten_dim, list_list_to_string(self.shape)))
         return ret
 
 
@@ -4034,7 +4105,11 @@ class ArmWhereOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmWhereOp, self).infer_shape()
         inputs = self.get_input_tensors()
-        out_tensor = np.where(*inputs)
+        condition = inputs[0]
+        if condition.dtype in (np.uint8, np.int8):
+            # Reinterpret the 1-byte mask as bool instead of converting it elementwise
+            condition = condition.view(np.bool_)
+        out_tensor = np.where(condition, inputs[1], inputs[2])
         self.set_out_tensor(out_tensor)
 
 
@@ -4061,18 +4136,17 @@ class ArmYuvToRgbOp(OpHasOneOutPort, ArmOp):
         super(ArmYuvToRgbOp, self).infer_shape()
         # input_shape = re.findall("\[[\s*\d+,]*\d+\]|\[\s*\]", self.shape)
         # input_shape = [[int(i) for i in re.findall("\d+", shape)] for shape in input_shape]
-        out_tensor = np.random.randn(*tuple(self.shape)).astype(self.out_dtype)
+        out_tensor = _shape_stub(self.shape, self.out_dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmYuvToRgbOp, self).write_attrs(txt_file)
         if ret:
-            for k in ['format', 'bits', 'conversion', 'coefficient', 'coefficient_dtype', 'coefficient_shift', 'shape']:
-                if k in ['coefficient', 'shape']:
-                    txt_file.write('%s=[%s]\n' % (
-                        k, num_list_to_string(getattr(self, k))))
-                else:
-                    txt_file.write('%s=%s\n' % (k, str(getattr(self, k))))
+            txt_file.writelines([('%s=[%s]\n' % (k, num_list_to_string(getattr(self, k))))
+                                 if k in ('coefficient', 'shape')
+                                 else ('%s=%s\n' % (k, str(getattr(self, k))))
+                                 for k in ['format', 'bits', 'conversion', 'coefficient',
+                                           'coefficient_dtype', 'coefficient_shift', 'shape']])
         return ret
 
 
@@ -4097,19 +4171,18 @@ class ArmRgbToYuvOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmRgbToYuvOp, self).infer_shape()
         input_shape = self.get_input_tensors()[0].shape
-        out_tensor = np.random.randn(input_shape[0], int(
-            input_shape[1]*input_shape[2]*1.5)).astype(self.out_dtype)
+        out_tensor = _shape_stub((input_shape[0], int(
+            input_shape[1]*input_shape[2]*1.5)), self.out_dtype)
         self.set_out_tensor(out_tensor)
 
     def write_attrs(self, txt_file):
         ret = super(ArmRgbToYuvOp, self).write_attrs(txt_file)
         if ret:
-            for k in ['format', 'bits', 'conversion', 'coefficient', 'coefficient_dtype', 'coefficient_shift']:
-                if k in ['coefficient']:
-                    txt_file.write('%s=[%s]\n' % (
-                        k, num_list_to_string(getattr(self, k))))
-                else:
-                    txt_file.write('%s=%s\n' % (k, str(getattr(self, k))))
+            txt_file.writelines([('%s=[%s]\n' % (k, num_list_to_string(getattr(self, k))))
+                                 if k == 'coefficient'
+                                 else ('%s=%s\n' % (k, str(getattr(self, k))))
+                                 for k in ['format', 'bits', 'conversion', 'coefficient',
+                                           'coefficient_dtype', 'coefficient_shift']])
         return ret
 
 
@@ -4117,5 +4190,10 @@ class ArmZeroFractionOp(OpHasOneOutPort, ArmOp):
     def infer_shape(self):
         super(ArmZeroFractionOp, self).infer_shape()
         input_tensor = self.get_input_tensors()[0]
-        out_tensor = np.array(tf.math.zero_fraction(input_tensor).eval())
+        if input_tensor.size == 0:
+            # Same as the mean over an empty tensor
+            out_tensor = np.array(np.nan, np.float32)
+        else:
+            zero_num = input_tensor.size - np.count_nonzero(input_tensor)
+            out_tensor = np.array(zero_num / input_tensor.size, np.float32)
         self.set_out_tensor(out_tensor)
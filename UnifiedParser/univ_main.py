@@ -2,28 +2,33 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import onnx
-import torch
-import tensorflow.compat.v1 as tf
 from collections import OrderedDict
 from .common.utils import is_file, is_dir, multi_string_to_list, list_string_to_list
 from .logger import *
-from .front_end.onnx.process import process_onnx
 from .front_end.onnx.passes.middle_passes import middle_passes, convert_onnx_version
 from .front_end.onnx.passes.back_passes import back_passes, trim_weights
 from .front_end.onnx.passes.transform import transform_to_nhwc
-from .front_end.lite.process import process_tflite
-from .front_end.caffe.process import process_caffe
 from .front_end.onnx.passes.common_passes import remove_useless_op
-from .front_end.tf.process import process_tf
-from .front_end.torch.process import convert_torch_to_onnx
-from .graph.graph_algo import infer, has_path
+from .graph.graph_algo import infer, reachable_nodes
 from .graph.pattern_match import matched_patterns, single_node_matcher
 from .writer import serialize
 from .preprocess import gamut_preprocess, preprocess
 from .misc import special_character_conversion
 
 
+_EAGER_EXECUTION_DISABLED = False
+
+
+def disable_eager_execution():
+    '''Disable eager execution of tensorflow 2.x, which only needs to be done once per process.'''
+    global _EAGER_EXECUTION_DISABLED
+    if not _EAGER_EXECUTION_DISABLED:
+        import tensorflow.compat.v1 as tf
+        if int(tf.__version__.split('.')[0]) >= 2:
+            tf.disable_eager_execution()
+        _EAGER_EXECUTION_DISABLED = True
+
+
 def univ_parser(params):
     ret = True
 
@@ -84,23 +89,28 @@ def univ_parser(params):
         if (is_file(model_path) or is_dir(model_path)) and is_dir(output_dir):
             graph = None
 
-            if int(tf.__version__.split('.')[0]) >= 2:
-                tf.disable_eager_execution()
+            disable_eager_execution()
 
             try:
                 # Convert torch model to onnx before processing
                 if model_type == 'torch':
+                    from .front_end.torch.process import convert_torch_to_onnx
                     model_path, params = convert_torch_to_onnx(model_path, params)
                     model_type = 'onnx'
 
-                '''The models under different frameworks are parsed and finally converted into representations under the onnx framework.'''
+                '''The models under different frameworks are parsed and finally converted into representations under the onnx framework.
+                Front ends are imported on demand so that only the requested framework gets loaded.'''
                 if model_type == 'onnx':
+                    from .front_end.onnx.process import process_onnx
                     graph = process_onnx(model_path, params)
                 elif model_type == 'tflite':
+                    from .front_end.lite.process import process_tflite
                     graph = process_tflite(model_path, params)
                 elif model_type == 'caffe':
+                    from .front_end.caffe.process import process_caffe
                     graph = process_caffe(model_path, params)
                 elif model_type in ('tf', 'tensorflow'):
+                    from .front_end.tf.process import process_tf
                     graph = process_tf(model_path, params)
                 else:
                     ERROR('[Parser]: Framework %s is not supported!' %
@@ -116,13 +126,9 @@ def univ_parser(params):
                 for input_name in input_names_list:
                     input_names.append(input_name['target'])
                 output_names = graph._attr.get('output_names')
+                reachable = reachable_nodes(graph, input_names)
                 for output_name in output_names:
-                    has_path_flag = False
-                    for input_name in input_names:
-                        if has_path(graph, input_name, output_name):
-                            has_path_flag = True
-                            break
-                    if has_path_flag is False:
+                    if output_name not in reachable:
                         ERROR('[Parser]: Graph is not a connected one!')
 
                 '''Gives a 'may be time consuming' hint for huge models.'''
@@ -147,6 +153,8 @@ def univ_parser(params):
                 except Exception as e:
                     WARN('[Parser]: Meets exception in middle_passes (%s)!' % str(e))
 
+                # middle_passes does not infer by itself, but transform_to_nhwc and back_passes read
+                # tensor shapes, so the graph has to be re-inferred here.
                 infer(graph)
 
                 try:
@@ -172,6 +180,8 @@ def univ_parser(params):
                     WARN(
                         '[Parser]: Meets exception in insert special character conversion (%s)!' % str(e))
 
+                # back_passes and the preprocess/conversion passes rewrite the graph after the infer
+                # above, so serialize needs one more full infer.
                 try:
                     infer(graph)
                     remove_useless_op(graph, ['ArmCast'])
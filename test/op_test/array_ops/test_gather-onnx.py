@@ -59,8 +59,8 @@ output_shape = [1]
 feed_dict = dict()
 feed_dict['X1'] = np.random.ranf(input_shape).astype(np.float32) * 100
 feed_dict['X2'] = np.array([10])
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 
 for indices in (-5, -3, 0, 2):
     model_name = '-'.join([OP_NAME, str(indices)])
@@ -40,8 +40,8 @@ output_shape = [1, 56, 28, 12]
 # Generate input data
 feed_dict = dict()
 feed_dict['X'] = np.random.ranf(input_shape).astype(np.float32) * 10
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 
 for count_include_pad in (0, 1):
     model_name = OP_NAME + '-' + str(count_include_pad)
@@ -56,5 +56,5 @@ for count_include_pad in (0, 1):
     assert exit_status
     # NOTE: The outputs are different for different count_include_pad in onnx even all the pads are 0.
     # And opt forward aligns with onnx runtime.
-    os.rename('opt_outputs.npy', 'opt_' + model_name + '.npy')
-    os.rename('onnx_outputs.npy', 'onnx_' + model_name + '.npy')
+    os.rename('opt_outputs.npz', 'opt_' + model_name + '.npz')
+    os.rename('onnx_outputs.npz', 'onnx_' + model_name + '.npz')
@@ -57,8 +57,8 @@ feed_dict = dict()
 input_data = np.random.ranf(input_shape).astype(np.float32) * 100
 # input_data = np.reshape(np.arange(np.prod(input_shape), dtype=np.float32), input_shape)
 feed_dict['X'] = input_data
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 
 for version in (11, 1):  # 1,
     model_name = '-'.join([OP_NAME, str(version)])
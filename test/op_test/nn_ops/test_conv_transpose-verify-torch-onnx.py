@@ -91,7 +91,7 @@ def run_torch(inp, weight, bias,
     # print('padded_res shape: %s' % str(padded_res.shape))
 
     res_dict = {'res': res}
-    np.save('torch', res_dict)
+    np.savez('torch.npz', **res_dict)
     return res_dict
 
 
@@ -107,8 +107,8 @@ feed_dict = dict()
 input_data = np.reshape(np.arange(np.prod(input_shape), dtype=np.float32), input_shape)
 # input_data = np.ones(input_shape).astype(np.float32)
 feed_dict['X'] = input_data
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 
 # weight = np.reshape(np.arange(np.prod(weight_shape), dtype=np.float32), weight_shape)
 weight = np.ones(weight_shape, dtype=np.float32)
@@ -227,8 +227,8 @@ weight_shape = [6, 10, 7, 8]
 # Generate input data
 feed_dict = dict()
 feed_dict['X'] = np.ones(input_shape).astype(np.float32) * 100
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 for version in (11, ):  # 1,
     model_name = '-'.join([OP_NAME, str(version)])
     model_path = model_name + '.onnx'
@@ -248,8 +248,8 @@ weight_shape = [6, 10, 7, 8]
 # Generate input data
 feed_dict = dict()
 feed_dict['X'] = np.ones(input_shape).astype(np.float32) * 100
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 for version in (11, ):  # 1,
     model_name = '-'.join([OP_NAME, str(version)])
     model_path = model_name + '.onnx'
@@ -269,8 +269,8 @@ weight_shape = [6, 10, 7, 8]
 # Generate input data
 feed_dict = dict()
 feed_dict['X'] = np.ones(input_shape).astype(np.float32) * 100
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 for version in (11, ):  # 1,
     model_name = '-'.join([OP_NAME, str(version)])
     model_path = model_name + '.onnx'
@@ -290,8 +290,8 @@ weight_shape = [6, 10, 7, 8]
 # Generate input data
 feed_dict = dict()
 feed_dict['X'] = np.ones(input_shape).astype(np.float32) * 100
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 for version in (11, ):  # 1,
     model_name = '-'.join([OP_NAME, str(version)])
     model_path = model_name + '.onnx'
@@ -311,8 +311,8 @@ weight_shape = [6, 10, 7, 8]
 # Generate input data
 feed_dict = dict()
 feed_dict['X'] = np.ones(input_shape).astype(np.float32) * 100
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 for version in (11, ):
     model_name = '-'.join([OP_NAME, str(version)])
     model_path = model_name + '.onnx'
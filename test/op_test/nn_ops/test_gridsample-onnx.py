@@ -41,8 +41,8 @@ grid_shape = [1, 64, 128, 2]
 feed_dict = dict()
 feed_dict['X'] = np.random.ranf(input_shape).astype(np.float32) * 100
 feed_dict['Grid'] = 2.0 * np.random.ranf(grid_shape).astype(np.float32) - 1.0
-input_data_path = 'input.npy'
-np.save(input_data_path, feed_dict)
+input_data_path = 'input.npz'
+np.savez(input_data_path, **feed_dict)
 
 # TODO: OPT doesn't support 'bicubic' and 'reflection' for now. Ignore it for now.
 for mode in ('bilinear', 'nearest', ):
@@ -44,6 +44,21 @@ def check_float_ir(ir_txt_path, expected_keywords, unexpected_keywords=[]):
     return False
 
 
+# Tensor names are passed to np.savez as keyword arguments, so names clashing with its own
+# parameters are prefixed when saving and restored when loading.
+_NPZ_KEY_PREFIX = '__npz_key__'
+
+
+def _escape_npz_key(key):
+    if key in ('file', 'allow_pickle') or key.startswith(_NPZ_KEY_PREFIX):
+        return _NPZ_KEY_PREFIX + key
+    return key
+
+
+def _unescape_npz_key(key):
+    return key[len(_NPZ_KEY_PREFIX):] if key.startswith(_NPZ_KEY_PREFIX) else key
+
+
 def get_feed_dict(data_path):
     ''' Return a dict from the provided numpy file.
     '''
@@ -52,14 +67,15 @@ def get_feed_dict(data_path):
     if not os.path.exists(data_path):
         ERROR('File %s does not exist!' % data_path)
 
-    try:
-        data = np.load(data_path, allow_pickle=True)
+    data = np.load(data_path, allow_pickle=True)
+    if hasattr(data, 'files'):
+        # Archive written by np.savez
+        for k in data.files:
+            feed_dict[_unescape_npz_key(k)] = data[k]
+    else:
+        # Dict pickled by np.save
         for k, v in data.item().items():
             feed_dict[k] = v
-    except:
-        data = np.load(data_path)
-        for k in data.files:
-            feed_dict[k] = data[k]
 
     return feed_dict
 
@@ -114,5 +130,5 @@ def save_data_to_file(file_path, data_dict):
     if os.path.exists(file_path):
         WARN('Original file %s is overwriten!' % file_path)
         os.remove(file_path)
-    np.save(file_path, data_dict)
+    np.savez(file_path, **{_escape_npz_key(k): v for k, v in data_dict.items()})
     INFO('Save output data to file %s' % file_path)
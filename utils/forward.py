@@ -27,7 +27,7 @@ def caffe_forward(proto_path, model_path, feed_dict, output_names=None, save_out
         output_dict[out_name] = out_data
 
     if save_output:
-        save_data_to_file('caffe_outputs.npy', output_dict)
+        save_data_to_file('caffe_outputs.npz', output_dict)
 
     return output_dict
 
@@ -76,7 +76,7 @@ def keras_forward(model_path, feed_dict, output_names=None, save_output=True):
         output_dict.update({out.name: out_value})
 
     if save_output:
-        save_data_to_file('tf_outputs.npy', output_dict)
+        save_data_to_file('tf_outputs.npz', output_dict)
 
     return output_dict
 
@@ -100,7 +100,7 @@ def onnx_forward(model_path, feed_dict, output_names=None, save_output=True):
         output_dict[out_name] = out_data
 
     if save_output:
-        save_data_to_file('onnx_outputs.npy', output_dict)
+        save_data_to_file('onnx_outputs.npz', output_dict)
 
     return output_dict
 
@@ -142,7 +142,7 @@ def tf_forward(model_path, feed_dict, output_names=None, save_output=True):
         output_dict[out_name] = out_data
 
     if save_output:
-        save_data_to_file('tf_outputs.npy', output_dict)
+        save_data_to_file('tf_outputs.npz', output_dict)
 
     return output_dict
 
@@ -167,7 +167,7 @@ def tflite_forward(model_path, feed_dict, output_names=None, save_output=True):
         output_dict[out_name] = output_data
 
     if save_output:
-        save_data_to_file('tflite_outputs.npy', output_dict)
+        save_data_to_file('tflite_outputs.npz', output_dict)
 
     return output_dict
 
@@ -230,6 +230,6 @@ def opt_forward(txt_path, bin_path, feed_dict, output_names=None, save_output=Tr
         output_dict[name] = value
 
     if save_output:
-        save_data_to_file('opt_outputs.npy', output_dict)
+        save_data_to_file('opt_outputs.npz', output_dict)
 
     return output_dict